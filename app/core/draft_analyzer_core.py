@@ -6,9 +6,71 @@ Core analysis logic for the Dota 2 Draft Analyzer.
 Handles data management and strategic analysis.
 """
 
-import json
 import os
-from typing import Dict, List, Any, Optional
+import pickle
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Any, Mapping, Optional, Set, Tuple
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - optional C extension
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional C extension
+    ahocorasick = None
+
+
+CACHE_FILE_NAME = '_cache.pkl'
+CACHE_VERSION = 2  # Bump when the shape of the cached data changes
+STRATEGY_LOAD_WORKERS = 8
+
+
+class LazyStrategyMap(Mapping[str, Dict[str, Any]]):
+    """Read-only mapping of hero safe_name to strategy data, loaded on first access."""
+
+    def __init__(self, safe_names: Iterable[str], loader: Callable[[str], Optional[Dict[str, Any]]]) -> None:
+        self._safe_names: List[str] = list(safe_names)
+        self._known: Set[str] = set(self._safe_names)
+        self._loader = loader
+        self._loaded: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def __getitem__(self, safe_name: str) -> Dict[str, Any]:
+        if safe_name not in self._known:
+            raise KeyError(safe_name)
+        if safe_name not in self._loaded:
+            self._loaded[safe_name] = self._loader(safe_name)
+        strategy = self._loaded[safe_name]
+        if strategy is None:
+            raise KeyError(safe_name)
+        return strategy
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._safe_names)
+
+    def __len__(self) -> int:
+        return len(self._safe_names)
+
+    def preload(self, strategies: Dict[str, Dict[str, Any]]) -> None:
+        """Seeds the map with already loaded strategies."""
+        self._loaded.update((name, data) for name, data in strategies.items() if name in self._known)
+
+    def load_all(self) -> Dict[str, Dict[str, Any]]:
+        """Loads every strategy not loaded yet and returns all valid ones."""
+        missing = [name for name in self._safe_names if name not in self._loaded]
+        if missing:
+            # Overlap the file reads of the remaining strategy files
+            with ThreadPoolExecutor(max_workers=STRATEGY_LOAD_WORKERS) as executor:
+                for name, strategy in zip(missing, executor.map(self._loader, missing)):
+                    self._loaded.setdefault(name, strategy)
+        return {name: self._loaded[name] for name in self._safe_names if self._loaded.get(name) is not None}
 
 
 class DataManager:
@@ -17,50 +79,167 @@ class DataManager:
     def __init__(self, data_path: str = 'data') -> None:
         self.data_path: str = data_path
         self.heroes: List[Dict[str, Any]] = []
-        self.hero_strategies: Dict[str, Dict[str, Any]] = {}
+        self.hero_strategies: LazyStrategyMap = LazyStrategyMap([], self._load_strategy)
         self.normalized_heroes: List[Dict[str, Any]] = []
         self.hero_name_map: Dict[str, Dict[str, str]] = {}
+        self.hero_counter_items: Dict[str, FrozenSet[str]] = {}
+        self.name_to_strategy: Dict[str, Dict[str, Any]] = {}
+        self._item_automaton: Optional[Any] = self._build_item_automaton()
+        self._item_pattern: Optional[re.Pattern] = None if self._item_automaton else self._build_item_pattern()
+        self._canonical_items: Dict[str, str] = dict(_COUNTER_ITEMS_LC)
 
         self._load_all_data()
 
+    @staticmethod
+    def _build_item_automaton() -> Optional[Any]:
+        """Builds an Aho-Corasick automaton over the lowercased counter items."""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for item_lc, item in _COUNTER_ITEMS_LC:
+            automaton.add_word(item_lc, item)
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _build_item_pattern() -> re.Pattern:
+        """Builds a single regex alternation over the lowercased counter items.
+
+        Used when pyahocorasick is not installed. The lookahead lets matches
+        overlap, and longer items are tried first at each position.
+        """
+        items = sorted((item_lc for item_lc, _ in _COUNTER_ITEMS_LC), key=len, reverse=True)
+        return re.compile('(?=(' + '|'.join(re.escape(item) for item in items) + '))')
+
+    def get_strategy(self, hero_name: str) -> Optional[Dict[str, Any]]:
+        """Returns the strategy data for a hero display name, resolving the name only once."""
+        strategy = self.name_to_strategy.get(hero_name)
+        if strategy is None:
+            hero_info = self.hero_name_map.get(hero_name)
+            if not hero_info:
+                return None
+            strategy = self.hero_strategies.get(hero_info['safe_name'])
+            if strategy:
+                self.name_to_strategy[hero_name] = strategy
+        return strategy
+
+    def get_counter_items(self, safe_name: str) -> FrozenSet[str]:
+        """Returns the counter items mentioned in a hero's counter tips, matching them only once."""
+        matched_items = self.hero_counter_items.get(safe_name)
+        if matched_items is None:
+            strategy = self.hero_strategies.get(safe_name)
+            counter_tips = strategy.get('strategies', {}).get('counter_tips', []) if strategy else []
+            # Scan tip by tip rather than building one large joined string
+            found: Set[str] = set()
+            for tip in counter_tips:
+                found.update(self.find_counter_items(tip.lower()))
+            matched_items = frozenset(found)
+            self.hero_counter_items[safe_name] = matched_items
+        return matched_items
+
+    def find_counter_items(self, text: str) -> Iterator[str]:
+        """Yields the counter items mentioned in the given lowercased text."""
+        if self._item_automaton is None:
+            return (self._canonical_items[m.group(1)] for m in self._item_pattern.finditer(text))
+        return (item for _, item in self._item_automaton.iter(text))
+
     def _load_json(self, file_name: str) -> Optional[Any]:
         """Loads a JSON file from the data path."""
         path = os.path.join(self.data_path, file_name)
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(path, 'rb') as f:
+                return json_loads(f.read())
         except FileNotFoundError:
             print(f"Error: {path} not found.")
-        except json.JSONDecodeError:
+        except ValueError:  # Every JSON backend's decode error derives from ValueError
             print(f"Error: Could not decode JSON from {path}.")
         return None
 
+    def _load_strategy(self, safe_name: str) -> Optional[Dict[str, Any]]:
+        """Loads the strategy file of a single hero."""
+        return self._load_json(os.path.join('howdoiplay_json', f'{safe_name}.json')) or None
+
+    def _strategy_files(self) -> List[str]:
+        """Returns the file names of all hero strategy JSON files."""
+        strategy_path = os.path.join(self.data_path, 'howdoiplay_json')
+        if not os.path.isdir(strategy_path):
+            return []
+        return sorted(f for f in os.listdir(strategy_path) if f.endswith('.json'))
+
+    def _cache_key(self, strategy_files: List[str]) -> Tuple[int, float]:
+        """Computes a key identifying the current state of the JSON source files."""
+        paths = [os.path.join(self.data_path, 'heroes.json'),
+                 os.path.join(self.data_path, 'normalized_heroes.json')]
+        paths += [os.path.join(self.data_path, 'howdoiplay_json', f) for f in strategy_files]
+        mtimes = [os.path.getmtime(p) for p in paths if os.path.exists(p)]
+        return len(mtimes), max(mtimes, default=0.0)
+
+    def _load_cache(self, key: Tuple[int, float]) -> Optional[Dict[str, Any]]:
+        """Loads the pickled data cache if it matches the given key."""
+        path = os.path.join(self.data_path, CACHE_FILE_NAME)
+        try:
+            with open(path, 'rb') as f:
+                cached = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable cache {path}: {e}")
+            return None
+        if not isinstance(cached, dict) or cached.get('version') != CACHE_VERSION or cached.get('key') != key:
+            return None
+        return cached
+
+    def _save_cache(self, key: Tuple[int, float]) -> None:
+        """Loads any remaining strategies and writes all data to the pickled data cache."""
+        path = os.path.join(self.data_path, CACHE_FILE_NAME)
+        cached = {
+            'version': CACHE_VERSION,
+            'key': key,
+            'heroes': self.heroes,
+            'normalized_heroes': self.normalized_heroes,
+            'strategies': self.hero_strategies.load_all(),
+        }
+        # Write to a temporary file first so an interrupted write never leaves a partial cache
+        tmp_path = f'{path}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(cached, f, protocol=5)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not write cache {path}: {e}")
+
     def _load_all_data(self) -> None:
-        """Loads all necessary data files into memory."""
+        """Loads the hero lists; hero strategies are loaded when first accessed."""
         print("Loading game data...")
-        self.heroes = self._load_json('heroes.json') or []
-        self.normalized_heroes = self._load_json('normalized_heroes.json') or []
+        strategy_files = self._strategy_files()
+        cache_key = self._cache_key(strategy_files)
+        cached = self._load_cache(cache_key)
+
+        # The filename is the safe_name
+        self.hero_strategies = LazyStrategyMap(
+            (filename.replace('.json', '') for filename in strategy_files), self._load_strategy
+        )
+
+        if cached:
+            self.heroes = cached['heroes']
+            self.normalized_heroes = cached['normalized_heroes']
+            self.hero_strategies.preload(cached['strategies'])
+        else:
+            self.heroes = self._load_json('heroes.json') or []
+            self.normalized_heroes = self._load_json('normalized_heroes.json') or []
+
+            # Rebuild the cache off the startup path so the next start is a single pickle load
+            threading.Thread(target=self._save_cache, args=(cache_key,), daemon=True).start()
 
         # Create a mapping from display name to a dict with safe_name and image_path
         self.hero_name_map = {
             hero['name']: {'safe_name': hero['safe_name'], 'image_path': hero.get('image_path', '')}
             for hero in self.normalized_heroes if 'name' in hero and 'safe_name' in hero
         }
-
-        # Load individual hero strategy files
-        strategy_path = os.path.join(self.data_path, 'howdoiplay_json')
-        if os.path.isdir(strategy_path):
-            for filename in os.listdir(strategy_path):
-                if filename.endswith('.json'):
-                    # The filename is the safe_name
-                    safe_hero_name = filename.replace('.json', '')
-                    strategy_data = self._load_json(os.path.join('howdoiplay_json', filename))
-                    if strategy_data:
-                        self.hero_strategies[safe_hero_name] = strategy_data
         
         print(f"Loaded {len(self.heroes)} heroes.")
         print(f"Loaded normalized data for {len(self.normalized_heroes)} heroes.")
-        print(f"Loaded strategies for {len(self.hero_strategies)} heroes.")
+        print(f"Found strategies for {len(self.hero_strategies)} heroes.")
 
 
 # List of common items to check for in counter tips.
@@ -123,6 +302,9 @@ COUNTER_ITEMS = [
     "Hand of Midas"         # Instakill creeps
 ]
 
+# (lowercased, display name) pairs, so item names are lowercased only once
+_COUNTER_ITEMS_LC: Tuple[Tuple[str, str], ...] = tuple((item.lower(), item) for item in COUNTER_ITEMS)
+
 
 class AnalysisCore:
     """Handles the logic for analyzing hero picks and generating advice."""
@@ -133,36 +315,25 @@ class AnalysisCore:
     def get_item_suggestions(self, enemy_heroes: List[str]) -> Dict[str, List[str]]:
         """ 
         Analyzes enemy heroes and suggests items to counter them.
-        Returns a dictionary mapping item names to a list of heroes they counter.
+        Returns a dictionary mapping item names to a sorted list of the heroes they counter.
         """
-        item_suggestions: Dict[str, List[str]] = {}
+        item_suggestions: Dict[str, Set[str]] = defaultdict(set)
 
         for hero_name in enemy_heroes:
             hero_info = self.data_manager.hero_name_map.get(hero_name)
             if not hero_info:
                 continue
 
-            strategy = self.data_manager.hero_strategies.get(hero_info['safe_name'])
-            if not strategy or 'counter_tips' not in strategy['strategies']:
-                continue
-
-            counter_tips_text = ' '.join(strategy['strategies']['counter_tips']).lower()
+            matched_items = self.data_manager.get_counter_items(hero_info['safe_name'])
+            for item in matched_items:
+                item_suggestions[item].add(hero_name)
 
-            for item in COUNTER_ITEMS:
-                if item.lower() in counter_tips_text:
-                    if item not in item_suggestions:
-                        item_suggestions[item] = []
-                    if hero_name not in item_suggestions[item]:
-                        item_suggestions[item].append(hero_name)
-        
-        return item_suggestions
+        # Keep the suggestions in COUNTER_ITEMS order regardless of match order
+        return {item: sorted(item_suggestions[item]) for item in COUNTER_ITEMS if item in item_suggestions}
 
     def get_strategic_tips(self, your_hero: str) -> List[str]:
         """Gets general strategy tips for the player's chosen hero."""
-        hero_info = self.data_manager.hero_name_map.get(your_hero)
-        if not hero_info:
-            return []
-        strategy = self.data_manager.hero_strategies.get(hero_info['safe_name'])
+        strategy = self.data_manager.get_strategy(your_hero)
         if strategy and 'general_tips' in strategy['strategies']:
             return strategy['strategies']['general_tips']
         return []
@@ -171,11 +342,7 @@ class AnalysisCore:
         """Gets tips on how to counter a list of enemy heroes."""
         counter_tips: Dict[str, List[str]] = {}
         for hero_name in enemy_heroes:
-            hero_info = self.data_manager.hero_name_map.get(hero_name)
-            if not hero_info:
-                continue
-
-            strategy = self.data_manager.hero_strategies.get(hero_info['safe_name'])
+            strategy = self.data_manager.get_strategy(hero_name)
             if strategy and 'counter_tips' in strategy['strategies']:
                 counter_tips[hero_name] = strategy['strategies']['counter_tips']
         return counter_tips
\ No newline at end of file
@@ -5,18 +5,24 @@
 Custom UI widgets for the Dota 2 Draft Analyzer.
 """
 
+import bisect
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Sequence
 
 
 class AutocompleteCombobox(ttk.Entry):
-    """A custom ttk.Entry widget with autocompletion functionality."""
+    """A custom ttk.Entry widget with autocompletion functionality.
 
-    def __init__(self, parent: tk.Widget, completion_list: List[str], *args, **kwargs) -> None:
+    The completion list must already be sorted case-insensitively; it is
+    used as given and may be shared between several widgets.
+    """
+
+    def __init__(self, parent: tk.Widget, completion_list: Sequence[str], *args, **kwargs) -> None:
         super().__init__(parent, *args, **kwargs)
-        self._completion_list: List[str] = sorted(completion_list)
-        self._hits: List[str] = []
+        self._completion_list: Sequence[str] = completion_list
+        self._lower_keys: List[str] = [item.lower() for item in completion_list]
+        self._hits: Sequence[str] = []
         self._hit_index: int = 0
         self.position: int = 0
         self.selection_callback: Optional[Callable[[str], None]] = None
@@ -24,6 +30,7 @@ class AutocompleteCombobox(ttk.Entry):
         self.bind('<KeyRelease>', self.handle_keyrelease)
         self.bind('<FocusIn>', self.handle_focus_in)
         self._listbox: Optional[tk.Listbox] = None
+        self._listbox_visible: bool = False
 
     def handle_focus_in(self, event: tk.Event) -> None:
         """Handle the widget gaining focus."""
@@ -46,32 +53,46 @@ class AutocompleteCombobox(ttk.Entry):
 
     def _update_autocomplete_list(self, show_all: bool = False) -> None:
         """Updates the autocomplete listbox based on the current entry text."""
-        if self._listbox:
-            self._listbox.destroy()
-            self._listbox = None
-
         text = self.get().lower()
         
         if show_all:
             self._hits = self._completion_list
         elif text:
-            self._hits = [item for item in self._completion_list if item.lower().startswith(text)]
+            # Matches of a prefix form a contiguous range of the sorted keys
+            lo = bisect.bisect_left(self._lower_keys, text)
+            hi = bisect.bisect_left(self._lower_keys, text + '\uffff')
+            self._hits = self._completion_list[lo:hi]
         else:
             self._hits = []
             
-        if self._hits:
-            # Calculate position relative to the root window
-            x_pos = self.winfo_rootx() - self.winfo_toplevel().winfo_rootx()
-            y_pos = self.winfo_rooty() - self.winfo_toplevel().winfo_rooty() + self.winfo_height()
-
+        if not self._hits:
+            self._hide_listbox()
+            return
+
+        listbox = self._get_listbox()
+        listbox.delete(0, tk.END)
+        listbox.insert(tk.END, *self._hits)
+
+        # Calculate position relative to the root window
+        x_pos = self.winfo_rootx() - self.winfo_toplevel().winfo_rootx()
+        y_pos = self.winfo_rooty() - self.winfo_toplevel().winfo_rooty() + self.winfo_height()
+        listbox.place(x=x_pos, y=y_pos, width=self.winfo_width())
+        listbox.lift()
+        self._listbox_visible = True
+
+    def _get_listbox(self) -> tk.Listbox:
+        """Returns the dropdown listbox, creating it on first use."""
+        if self._listbox is None:
             self._listbox = tk.Listbox(self.winfo_toplevel(), font=self.cget('font'), relief='flat', highlightthickness=0)
-            self._listbox.place(x=x_pos, y=y_pos, width=self.winfo_width())
-            
-            for item in self._hits:
-                self._listbox.insert(tk.END, item)
-
             self._listbox.bind('<ButtonRelease-1>', self._on_listbox_select)
             self.winfo_toplevel().bind('<Button-1>', self._on_parent_click, add='+')
+        return self._listbox
+
+    def _hide_listbox(self) -> None:
+        """Hides the dropdown listbox while keeping it for reuse."""
+        if self._listbox is not None and self._listbox_visible:
+            self._listbox.place_forget()
+        self._listbox_visible = False
 
     def _on_listbox_select(self, event: tk.Event) -> None:
         """Event handler for listbox selection."""
@@ -79,8 +100,7 @@ class AutocompleteCombobox(ttk.Entry):
             selection = self._listbox.get(self._listbox.curselection())
             self.delete(0, tk.END)
             self.insert(0, selection)
-            self._listbox.destroy()
-            self._listbox = None
+            self._hide_listbox()
             self.icursor(tk.END)
             if self.selection_callback:
                 self.selection_callback(selection)
@@ -91,7 +111,6 @@ class AutocompleteCombobox(ttk.Entry):
 
     def _on_parent_click(self, event: tk.Event) -> None:
         """Event handler for clicks outside the widget."""
-        if self._listbox:
+        if self._listbox_visible:
             if event.widget != self._listbox and event.widget != self:
-                self._listbox.destroy()
-                self._listbox = None
\ No newline at end of file
+                self._hide_listbox()
\ No newline at end of file
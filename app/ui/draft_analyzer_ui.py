@@ -7,6 +7,8 @@ Main UI components for the Dota 2 Draft Analyzer.
 
 import tkinter as tk
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import font as tkfont
 from tkinter import ttk
 from PIL import Image, ImageTk
 from typing import List, Dict, Tuple, Optional, Any
@@ -26,38 +28,88 @@ class MainApplication:
         self.root.geometry("1200x800")
         self.root.minsize(1000, 700)
 
+        # One named font and label styles shared by every label instead of per-widget font specs
+        self._body_font = tkfont.Font(root=self.root, family="Segoe UI", size=10)
+        style = ttk.Style(self.root)
+        style.configure('Body.TLabel', font=self._body_font)
+        style.configure('Muted.TLabel', font=self._body_font, foreground="gray")
+
         print("Initializing UI...")
         self.data_manager = DataManager()
         self.analyzer = AnalysisCore(self.data_manager)
-        # Use the more comprehensive normalized_heroes data for names
-        self.hero_names = sorted([hero['name'] for hero in self.data_manager.normalized_heroes])
+        # Use the more comprehensive normalized_heroes data for names.
+        # Sorted once and shared by every hero selection widget.
+        self.hero_names: Tuple[str, ...] = tuple(sorted((hero['name'] for hero in self.data_manager.normalized_heroes), key=str.lower))
         self.hero_image_labels: Dict[str, ttk.Label] = {}
         self.hero_image_references: Dict[str, Any] = {}  # To prevent garbage collection
+        self._image_cache: Dict[Tuple[str, Tuple[int, int]], ImageTk.PhotoImage] = {}
+        # Decodes selection images off the Tk thread; widgets are only touched on the Tk thread
+        self._image_executor = ThreadPoolExecutor(max_workers=2)
+        self._pending_images: Dict[str, str] = {}  # label_key -> most recently selected hero
+        self._result_widgets: Optional[Dict[str, Any]] = None
 
         self._create_widgets()
 
+    @staticmethod
+    def _decode_image(image_path: str, size: Tuple[int, int]) -> Image.Image:
+        """Opens an image and resizes it. Safe to call from a worker thread."""
+        with Image.open(image_path) as img:
+            return img.resize(size, Image.Resampling.LANCZOS)
+
+    def _get_photo(self, hero_info: Dict[str, str], size: Tuple[int, int]) -> ImageTk.PhotoImage:
+        """Returns the hero's image resized to the given size, decoding it only once."""
+        key = (hero_info['safe_name'], size)
+        photo = self._image_cache.get(key)
+        if photo is None:
+            image_path = os.path.join(self.data_manager.data_path, hero_info['image_path'])
+            photo = ImageTk.PhotoImage(self._decode_image(image_path, size))
+            self._image_cache[key] = photo
+        return photo
+
     def _update_hero_image(self, hero_name: str, label_key: str) -> None:
         """Loads and displays the image for the selected hero."""
         hero_info = self.data_manager.hero_name_map.get(hero_name)
         image_label = self.hero_image_labels.get(label_key)
+        self._pending_images.pop(label_key, None)
 
         if not hero_info or not image_label or not hero_info.get('image_path'):
             if image_label:
                 image_label.config(image='')
             return
 
-        try:
-            image_path = os.path.join(self.data_manager.data_path, hero_info['image_path'])
-            img = Image.open(image_path)
-            img = img.resize((64, 36), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-
+        size = (64, 36)
+        photo = self._image_cache.get((hero_info['safe_name'], size))
+        if photo is not None:
             image_label.config(image=photo)
             self.hero_image_references[label_key] = photo  # Keep a reference
+            return
+
+        # Decode in the background and hand the result back to the Tk thread
+        self._pending_images[label_key] = hero_name
+        image_path = os.path.join(self.data_manager.data_path, hero_info['image_path'])
+        future = self._image_executor.submit(self._decode_image, image_path, size)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_hero_image_decoded, f, hero_name, label_key, size)
+        )
+
+    def _on_hero_image_decoded(self, future: Future, hero_name: str, label_key: str, size: Tuple[int, int]) -> None:
+        """Displays a decoded hero image unless a newer selection replaced it."""
+        if self._pending_images.get(label_key) != hero_name:
+            return
+        del self._pending_images[label_key]
+
+        hero_info = self.data_manager.hero_name_map[hero_name]
+        image_label = self.hero_image_labels[label_key]
+        try:
+            photo = ImageTk.PhotoImage(future.result())
         except Exception as e:
             print(f"Error loading image for {hero_name}: {e}")
-            if image_label:
-                image_label.config(image='')
+            image_label.config(image='')
+            return
+
+        self._image_cache[(hero_info['safe_name'], size)] = photo
+        image_label.config(image=photo)
+        self.hero_image_references[label_key] = photo  # Keep a reference
 
     def _create_widgets(self) -> None:
         """Creates and places all widgets in the main window."""
@@ -83,11 +135,11 @@ class MainApplication:
             self.hero_image_labels[label_key] = img_label
 
             # Text Label
-            label = ttk.Label(selection_frame, text=label_text, font=("Segoe UI", 10))
+            label = ttk.Label(selection_frame, text=label_text, style='Body.TLabel')
             label.grid(row=row_index, column=1, sticky=tk.W, pady=3, padx=(10, 5))
             
             # Autocomplete Entry
-            combo = AutocompleteCombobox(selection_frame, completion_list=self.hero_names, font=("Segoe UI", 10))
+            combo = AutocompleteCombobox(selection_frame, completion_list=self.hero_names, font=self._body_font)
             combo.grid(row=row_index, column=2, sticky=(tk.W, tk.E), pady=3, padx=(0, 5))
             combo.selection_callback = lambda hero_name, lk=label_key: self._update_hero_image(hero_name, lk)
 
@@ -98,11 +150,9 @@ class MainApplication:
             return combo
 
         self.your_hero_combo = create_hero_row("Your Hero:", 0, 'your_hero')
-        self.enemy_hero_1 = create_hero_row("Enemy Hero 1:", 1, 'enemy_1')
-        self.enemy_hero_2 = create_hero_row("Enemy Hero 2:", 2, 'enemy_2')
-        self.enemy_hero_3 = create_hero_row("Enemy Hero 3:", 3, 'enemy_3')
-        self.enemy_hero_4 = create_hero_row("Enemy Hero 4:", 4, 'enemy_4')
-        self.enemy_hero_5 = create_hero_row("Enemy Hero 5:", 5, 'enemy_5')
+        self.enemy_combos: List[AutocompleteCombobox] = [
+            create_hero_row(f"Enemy Hero {i}:", i, f'enemy_{i}') for i in range(1, 6)
+        ]
 
         # --- Analysis Button --- #
         analyze_frame = ttk.Frame(main_frame)
@@ -158,112 +208,120 @@ class MainApplication:
 
 
 
+    def _get_result_widgets(self) -> Dict[str, Any]:
+        """Returns the pooled result widgets, creating the fixed ones on first use."""
+        if self._result_widgets is None:
+            error_label = ttk.Label(self.scrollable_frame, text="Please select your hero and at least one enemy hero.")
+            error_label.grid(row=0, column=0, sticky='w', padx=5, pady=5)
+
+            item_frame = ttk.LabelFrame(self.scrollable_frame, text="🛡️ Item Suggestions", padding=15)
+            item_frame.grid(row=0, column=0, sticky='ew', padx=10, pady=8)
+            item_frame.columnconfigure(0, weight=1)
+
+            your_hero_frame = ttk.LabelFrame(self.scrollable_frame, padding=15)
+            your_hero_frame.grid(row=1, column=0, sticky='ew', padx=10, pady=8)
+            your_hero_frame.columnconfigure(0, weight=1)
+
+            self._result_widgets = {
+                'error_label': error_label,
+                'item_frame': item_frame,
+                'item_labels': [],
+                'your_hero_frame': your_hero_frame,
+                'your_hero_labels': [],
+                'enemy_sections': [],
+            }
+        return self._result_widgets
+
+    def _get_enemy_section(self, index: int) -> Dict[str, Any]:
+        """Returns the pooled counter-tips section for the enemy at the given index."""
+        sections: List[Dict[str, Any]] = self._get_result_widgets()['enemy_sections']
+        while len(sections) <= index:
+            hero_frame = ttk.LabelFrame(self.scrollable_frame, padding=15)
+            hero_frame.grid(row=2 + len(sections), column=0, sticky='ew', padx=10, pady=8)
+            hero_frame.columnconfigure(1, weight=1)
+            img_label = ttk.Label(hero_frame)
+            img_label.grid(row=0, column=0, padx=(0, 15), sticky='n')
+            sections.append({'frame': hero_frame, 'image_label': img_label, 'tip_labels': []})
+        return sections[index]
+
+    def _show_lines(self, frame: ttk.LabelFrame, labels: List[ttk.Label], lines: List[str],
+                    column: int = 0, wraplength: int = 1000, style: str = 'Body.TLabel') -> None:
+        """Shows one pooled label per line in the frame, creating labels as needed and hiding the rest."""
+        while len(labels) < len(lines):
+            label = ttk.Label(frame, wraplength=wraplength, justify=tk.LEFT, style='Body.TLabel')
+            label.grid(row=len(labels), column=column, sticky='w', pady=2)
+            labels.append(label)
+        for label, line in zip(labels, lines):
+            label.config(text=line, style=style)
+            label.grid()
+        for label in labels[len(lines):]:
+            label.grid_remove()
+
     def run_analysis(self) -> None:
         """Runs the analysis based on user input and displays the results."""
         your_hero = self.your_hero_combo.get()
         
-        enemy_heroes = [
-            self.enemy_hero_1.get(),
-            self.enemy_hero_2.get(),
-            self.enemy_hero_3.get(),
-            self.enemy_hero_4.get(),
-            self.enemy_hero_5.get(),
-        ]
+        enemy_heroes = [combo.get() for combo in self.enemy_combos]
         enemy_heroes = sorted(list(set(h for h in enemy_heroes if h)))  # Filter out empty and duplicate selections
 
+        # Result widgets are reused between runs; only their contents change
+        widgets = self._get_result_widgets()
+
         if not your_hero or not enemy_heroes:
-            # Clear previous results and show error
-            for widget in self.scrollable_frame.winfo_children():
-                widget.destroy()
-            error_label = ttk.Label(self.scrollable_frame, text="Please select your hero and at least one enemy hero.")
-            error_label.grid(row=0, column=0, sticky='w', padx=5, pady=5)
+            # Hide previous results and show error
+            widgets['item_frame'].grid_remove()
+            widgets['your_hero_frame'].grid_remove()
+            for section in widgets['enemy_sections']:
+                section['frame'].grid_remove()
+            widgets['error_label'].grid()
             return
 
-        # Clear previous results
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
-        # --- Get and display results ---
-        row_counter = 0
+        widgets['error_label'].grid_remove()
 
         # 1. Item Suggestions
         item_advice = self.analyzer.get_item_suggestions(enemy_heroes)
-        item_frame = ttk.LabelFrame(self.scrollable_frame, text="🛡️ Item Suggestions", padding=15)
-        item_frame.grid(row=row_counter, column=0, sticky='ew', padx=10, pady=8)
-        item_frame.columnconfigure(0, weight=1)
-        row_counter += 1
-
         if item_advice:
-            for i, (item, heroes) in enumerate(item_advice.items()):
-                unique_heroes = sorted(list(set(heroes)))
-                label = ttk.Label(
-                    item_frame, 
-                    text=f"• {item}: Recommended against {', '.join(unique_heroes)}",
-                    font=("Segoe UI", 10),
-                    wraplength=1000
-                )
-                label.grid(row=i, column=0, sticky='w', pady=2)
+            lines = [f"• {item}: Recommended against {', '.join(heroes)}" for item, heroes in item_advice.items()]
+            self._show_lines(widgets['item_frame'], widgets['item_labels'], lines)
         else:
-            ttk.Label(
-                item_frame, 
-                text="No specific item counters found.",
-                font=("Segoe UI", 10),
-                foreground="gray"
-            ).grid(row=0, column=0, sticky='w')
+            self._show_lines(widgets['item_frame'], widgets['item_labels'],
+                             ["No specific item counters found."], style='Muted.TLabel')
+        widgets['item_frame'].grid()
 
         # 2. Strategic Tips for your hero
-        your_hero_frame = ttk.LabelFrame(self.scrollable_frame, text=f"⚡ Tips for {your_hero}", padding=15)
-        your_hero_frame.grid(row=row_counter, column=0, sticky='ew', padx=10, pady=8)
-        your_hero_frame.columnconfigure(0, weight=1)
-        row_counter += 1
+        your_hero_frame = widgets['your_hero_frame']
+        your_hero_frame.config(text=f"⚡ Tips for {your_hero}")
         your_hero_tips = self.analyzer.get_strategic_tips(your_hero)
         if your_hero_tips:
-            for i, tip in enumerate(your_hero_tips[:5]):
-                label = ttk.Label(
-                    your_hero_frame, 
-                    text=f"• {tip}", 
-                    wraplength=1000, 
-                    justify=tk.LEFT,
-                    font=("Segoe UI", 10)
-                )
-                label.grid(row=i, column=0, sticky='w', pady=2)
+            self._show_lines(your_hero_frame, widgets['your_hero_labels'], [f"• {tip}" for tip in your_hero_tips[:5]])
         else:
-            ttk.Label(
-                your_hero_frame, 
-                text="No tips found.",
-                font=("Segoe UI", 10),
-                foreground="gray"
-            ).grid(row=0, column=0, sticky='w')
+            self._show_lines(your_hero_frame, widgets['your_hero_labels'], ["No tips found."], style='Muted.TLabel')
+        your_hero_frame.grid()
 
         # 3. Counter Tips for enemies
         counter_tips = self.analyzer.get_counter_tips(enemy_heroes)
-        if counter_tips:
-            for hero, tips in counter_tips.items():
-                hero_frame = ttk.LabelFrame(self.scrollable_frame, text=f"🎯 How to Counter {hero}", padding=15)
-                hero_frame.grid(row=row_counter, column=0, sticky='ew', padx=10, pady=8)
-                hero_frame.columnconfigure(1, weight=1)
-                row_counter += 1
-
-                # Display hero image
-                hero_info = self.data_manager.hero_name_map.get(hero)
-                if hero_info and hero_info.get('image_path'):
-                    try:
-                        image_path = os.path.join(self.data_manager.data_path, hero_info['image_path'])
-                        img = Image.open(image_path).resize((80, 45), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                        img_label = ttk.Label(hero_frame, image=photo)
-                        img_label.image = photo  # Keep reference
-                        img_label.grid(row=0, column=0, rowspan=len(tips[:3]), padx=(0, 15), sticky='n')
-                    except Exception as e:
-                        print(f"Error loading image for {hero}: {e}")
-
-                # Display tips
-                for i, tip in enumerate(tips[:3]):
-                    label = ttk.Label(
-                        hero_frame, 
-                        text=f"• {tip}", 
-                        wraplength=900, 
-                        justify=tk.LEFT,
-                        font=("Segoe UI", 10)
-                    )
-                    label.grid(row=i, column=1, sticky='w', pady=2)
\ No newline at end of file
+        for index, (hero, tips) in enumerate(counter_tips.items()):
+            section = self._get_enemy_section(index)
+            hero_frame = section['frame']
+            hero_frame.config(text=f"🎯 How to Counter {hero}")
+            hero_frame.grid()
+
+            # Display hero image
+            img_label = section['image_label']
+            img_label.config(image='')
+            img_label.grid_remove()
+            hero_info = self.data_manager.hero_name_map.get(hero)
+            if hero_info and hero_info.get('image_path'):
+                try:
+                    photo = self._get_photo(hero_info, (80, 45))
+                    img_label.config(image=photo)
+                    img_label.grid(rowspan=max(1, len(tips[:3])))
+                except Exception as e:
+                    print(f"Error loading image for {hero}: {e}")
+
+            # Display tips
+            self._show_lines(hero_frame, section['tip_labels'], [f"• {tip}" for tip in tips[:3]],
+                             column=1, wraplength=900)
+
+        for section in widgets['enemy_sections'][len(counter_tips):]:
+            section['frame'].grid_remove()